@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using System.IO;
 using System.Windows;
 using Microsoft.Win32;
@@ -11,6 +12,21 @@ namespace IEVRModManager
     /// </summary>
     public partial class App : Application
     {
+        private static readonly Uri DefaultThemeResource = new Uri("Themes/DarkTheme.xaml", UriKind.Relative);
+
+        // Theme name -> resource dictionary, built once instead of on every theme application
+        private static readonly IReadOnlyDictionary<string, Uri> ThemeResources = new Dictionary<string, Uri>
+        {
+            ["Light"] = new Uri("Themes/LightTheme.xaml", UriKind.Relative),
+            ["Dark"] = DefaultThemeResource,
+            ["Christmas"] = new Uri("Themes/ChristmasTheme.xaml", UriKind.Relative),
+            ["Red"] = new Uri("Themes/RedTheme.xaml", UriKind.Relative),
+            ["Blue"] = new Uri("Themes/BlueTheme.xaml", UriKind.Relative),
+            ["Purple"] = new Uri("Themes/PurpleTheme.xaml", UriKind.Relative),
+            ["Pastel"] = new Uri("Themes/PastelTheme.xaml", UriKind.Relative),
+            ["Neon"] = new Uri("Themes/NeonTheme.xaml", UriKind.Relative)
+        };
+
         /// <summary>
         /// Initializes a new instance of the <see cref="App"/> class and sets up exception handlers.
         /// </summary>
@@ -36,18 +52,38 @@ namespace IEVRModManager
             logger.SetDebugLogging(true);
 #endif
             
-            ApplyLanguage();
-            ApplyTheme();
+            // Load the configuration once and share it; each load parses the file and may probe Steam
+            var config = LoadStartupConfig();
+            ApplyLanguage(config);
+            ApplyTheme(config);
             logger.Info("App starting.", true);
             base.OnStartup(e);
         }
 
-        private void ApplyLanguage()
+        private static Models.AppConfig LoadStartupConfig()
+        {
+            try
+            {
+                return new Managers.ConfigManager().Load();
+            }
+            catch (Exceptions.ConfigurationException ex)
+            {
+                Helpers.Logger.Instance.Error("Configuration error while loading startup settings", true);
+                Helpers.Logger.Instance.Log(LogLevel.Error, "Configuration error details", true, ex);
+            }
+            catch (Exception ex)
+            {
+                Helpers.Logger.Instance.Error("Error loading startup settings", true);
+                Helpers.Logger.Instance.Log(LogLevel.Error, "Error details", true, ex);
+            }
+
+            return Models.AppConfig.Default();
+        }
+
+        private void ApplyLanguage(Models.AppConfig config)
         {
             try
             {
-                var configManager = new Managers.ConfigManager();
-                var config = configManager.Load();
                 string language = string.IsNullOrWhiteSpace(config.Language) ? "System" : config.Language;
                 Helpers.Logger.Instance.Info($"Applying language: {language}", true);
                 Helpers.LocalizationHelper.SetLanguage(language);
@@ -55,11 +91,6 @@ namespace IEVRModManager
                 var testString = Helpers.LocalizationHelper.GetString("AppTitle");
                 Helpers.Logger.Instance.Debug($"Test string 'AppTitle' = '{testString}'", true);
             }
-            catch (Exceptions.ConfigurationException ex)
-            {
-                Helpers.Logger.Instance.Error("Configuration error while applying language", true);
-                Helpers.Logger.Instance.Log(LogLevel.Error, "Configuration error details", true, ex);
-            }
             catch (Exception ex)
             {
                 Helpers.Logger.Instance.Error("Error applying language", true);
@@ -67,12 +98,10 @@ namespace IEVRModManager
             }
         }
 
-        private void ApplyTheme()
+        private void ApplyTheme(Models.AppConfig config)
         {
             try
             {
-                var configManager = new Managers.ConfigManager();
-                var config = configManager.Load();
                 string theme = string.IsNullOrWhiteSpace(config.Theme) ? "System" : config.Theme;
 
                 string themeToUse = theme == "System" 
@@ -91,24 +120,17 @@ namespace IEVRModManager
 
         private void ApplyThemeResource(string themeName)
         {
-            var resources = Current.Resources;
-            resources.MergedDictionaries.Clear();
+            var themeUri = ThemeResources.TryGetValue(themeName, out var uri) ? uri : DefaultThemeResource;
+            var mergedDictionaries = Current.Resources.MergedDictionaries;
 
-            var themeDict = new ResourceDictionary();
-            var themePath = themeName switch
+            // Reloading the same dictionary would re-parse the XAML and re-resolve every style for nothing
+            if (mergedDictionaries.Count == 1 && Equals(mergedDictionaries[0].Source, themeUri))
             {
-                "Light" => "Themes/LightTheme.xaml",
-                "Dark" => "Themes/DarkTheme.xaml",
-                "Christmas" => "Themes/ChristmasTheme.xaml",
-                "Red" => "Themes/RedTheme.xaml",
-                "Blue" => "Themes/BlueTheme.xaml",
-                "Purple" => "Themes/PurpleTheme.xaml",
-                "Pastel" => "Themes/PastelTheme.xaml",
-                "Neon" => "Themes/NeonTheme.xaml",
-                _ => "Themes/DarkTheme.xaml"
-            };
-            themeDict.Source = new Uri(themePath, UriKind.Relative);
-            resources.MergedDictionaries.Add(themeDict);
+                return;
+            }
+
+            mergedDictionaries.Clear();
+            mergedDictionaries.Add(new ResourceDictionary { Source = themeUri });
         }
 
         private bool IsSystemThemeDark()
@@ -19,6 +19,19 @@ namespace IEVRModManager.Helpers
         private static Dictionary<string, Dictionary<string, string>>? _allStrings;
         private static CultureInfo? _currentCulture;
         private static readonly object _lockObject = new object();
+        private static string _resourcesDir = string.Empty;
+        private static bool _loadFromFileSystem;
+        private static string? _appliedLanguageCode;
+
+        // Language key -> YAML file name. Files are only parsed the first time their language is requested.
+        private static readonly IReadOnlyDictionary<string, string> LanguageFiles = new Dictionary<string, string>
+        {
+            ["en-US"] = "Strings.yaml",
+            ["es-ES"] = "Strings.es-ES.yaml",
+            ["fr-FR"] = "Strings.fr-FR.yaml",
+            ["de-DE"] = "Strings.de-DE.yaml",
+            ["ja-JP"] = "Strings.ja-JP.yaml"
+        };
 
         static LocalizationHelper()
         {
@@ -33,15 +46,13 @@ namespace IEVRModManager.Helpers
                 
                 try
                 {
-                    var resourcesDir = GetResourcesDirectory();
-                    bool loadedFromFiles = TryLoadFromFileSystem(resourcesDir);
+                    _resourcesDir = GetResourcesDirectory();
+                    _loadFromFileSystem = LanguageFiles.Values.Any(fileName => File.Exists(Path.Combine(_resourcesDir, fileName)));
 
-                    if (!loadedFromFiles)
-                    {
-                        TryLoadFromEmbeddedResources();
-                    }
+                    // Only the fallback language is loaded up front; others are loaded on first use
+                    EnsureLanguageLoaded("en-US");
 
-                    if (_allStrings.Count == 0)
+                    if (!_allStrings.ContainsKey("en-US"))
                     {
                         _allStrings["en-US"] = new Dictionary<string, string>();
                     }
@@ -72,125 +83,37 @@ namespace IEVRModManager.Helpers
             return resourcesDir;
         }
 
-        private static bool TryLoadFromFileSystem(string resourcesDir)
+        private static void EnsureLanguageLoaded(string langKey)
         {
-            if (_allStrings == null)
-            {
-                return false;
-            }
-
-            var defaultPath = Path.Combine(resourcesDir, "Strings.yaml");
-            var spanishPath = Path.Combine(resourcesDir, "Strings.es-ES.yaml");
-            var frenchPath = Path.Combine(resourcesDir, "Strings.fr-FR.yaml");
-            var germanPath = Path.Combine(resourcesDir, "Strings.de-DE.yaml");
-            var japanesePath = Path.Combine(resourcesDir, "Strings.ja-JP.yaml");
-            bool loadedAny = false;
-
-            if (File.Exists(defaultPath))
-            {
-                _allStrings["en-US"] = LoadYamlFile(defaultPath);
-                loadedAny = true;
-            }
-
-            if (File.Exists(spanishPath))
-            {
-                _allStrings["es-ES"] = LoadYamlFile(spanishPath);
-                loadedAny = true;
-            }
-
-            if (File.Exists(frenchPath))
+            if (_allStrings == null || _allStrings.ContainsKey(langKey) || !LanguageFiles.TryGetValue(langKey, out var fileName))
             {
-                _allStrings["fr-FR"] = LoadYamlFile(frenchPath);
-                loadedAny = true;
+                return;
             }
 
-            if (File.Exists(germanPath))
+            Dictionary<string, string>? strings;
+            if (_loadFromFileSystem)
             {
-                var germanStrings = LoadYamlFile(germanPath);
-                if (germanStrings != null && germanStrings.Count > 0)
-                {
-                    _allStrings["de-DE"] = germanStrings;
-                    Instance.Log(LogLevel.Info, $"Successfully loaded {germanStrings.Count} German strings from {germanPath} and stored with key 'de-DE'", true);
-                    // Verify the key was stored correctly
-                    if (_allStrings.ContainsKey("de-DE"))
-                    {
-                        Instance.Log(LogLevel.Debug, $"Verified: 'de-DE' key exists in _allStrings with {_allStrings["de-DE"].Count} entries", true);
-                    }
-                    else
-                    {
-                        Instance.Log(LogLevel.Error, $"ERROR: 'de-DE' key was NOT stored in _allStrings!", true);
-                    }
-                }
-                else
+                var filePath = Path.Combine(_resourcesDir, fileName);
+                if (!File.Exists(filePath))
                 {
-                    Instance.Log(LogLevel.Warning, $"German file {germanPath} exists but loaded 0 strings", true);
+                    Instance.Log(LogLevel.Debug, $"Localization file not found at {filePath}", true);
+                    return;
                 }
-                loadedAny = true;
+                strings = LoadYamlFile(filePath);
             }
             else
             {
-                Instance.Log(LogLevel.Warning, $"German file not found at {germanPath}", true);
+                strings = LoadYamlFromEmbeddedResource($"IEVRModManager.Resources.{fileName}");
             }
 
-            if (File.Exists(japanesePath))
+            if (strings != null && strings.Count > 0)
             {
-                var japaneseStrings = LoadYamlFile(japanesePath);
-                if (japaneseStrings != null && japaneseStrings.Count > 0)
-                {
-                    _allStrings["ja-JP"] = japaneseStrings;
-                    Instance.Log(LogLevel.Info, $"Successfully loaded {japaneseStrings.Count} Japanese strings from {japanesePath} and stored with key 'ja-JP'", true);
-                }
-                else
-                {
-                    Instance.Log(LogLevel.Warning, $"Japanese file {japanesePath} exists but loaded 0 strings", true);
-                }
-                loadedAny = true;
+                _allStrings[langKey] = strings;
+                Instance.Log(LogLevel.Debug, $"Loaded {strings.Count} strings for language '{langKey}'", true);
             }
             else
             {
-                Instance.Log(LogLevel.Debug, $"Japanese file not found at {japanesePath}", true);
-            }
-
-            return loadedAny;
-        }
-
-        private static void TryLoadFromEmbeddedResources()
-        {
-            if (_allStrings == null)
-            {
-                return;
-            }
-
-            var englishResource = LoadYamlFromEmbeddedResource("IEVRModManager.Resources.Strings.yaml");
-            if (englishResource != null && englishResource.Count > 0)
-            {
-                _allStrings["en-US"] = englishResource;
-            }
-
-            var spanishResource = LoadYamlFromEmbeddedResource("IEVRModManager.Resources.Strings.es-ES.yaml");
-            if (spanishResource != null && spanishResource.Count > 0)
-            {
-                _allStrings["es-ES"] = spanishResource;
-            }
-
-            var frenchResource = LoadYamlFromEmbeddedResource("IEVRModManager.Resources.Strings.fr-FR.yaml");
-            if (frenchResource != null && frenchResource.Count > 0)
-            {
-                _allStrings["fr-FR"] = frenchResource;
-            }
-
-            var germanResource = LoadYamlFromEmbeddedResource("IEVRModManager.Resources.Strings.de-DE.yaml");
-            if (germanResource != null && germanResource.Count > 0)
-            {
-                _allStrings["de-DE"] = germanResource;
-                Instance.Log(LogLevel.Debug, $"Loaded {germanResource.Count} German strings from embedded resource", true);
-            }
-
-            var japaneseResource = LoadYamlFromEmbeddedResource("IEVRModManager.Resources.Strings.ja-JP.yaml");
-            if (japaneseResource != null && japaneseResource.Count > 0)
-            {
-                _allStrings["ja-JP"] = japaneseResource;
-                Instance.Log(LogLevel.Debug, $"Loaded {japaneseResource.Count} Japanese strings from embedded resource", true);
+                Instance.Log(LogLevel.Warning, $"Localization file for '{langKey}' loaded 0 strings", true);
             }
         }
 
@@ -322,6 +245,16 @@ namespace IEVRModManager.Helpers
         public static void SetLanguage(string languageCode)
         {
             Instance.Log(LogLevel.Info, $"SetLanguage called with languageCode: '{languageCode}'", true);
+
+            lock (_lockObject)
+            {
+                // Re-resolving the culture and swapping string tables for the language already in use is wasted work
+                if (_currentStrings != null && string.Equals(_appliedLanguageCode, languageCode, StringComparison.Ordinal))
+                {
+                    return;
+                }
+            }
+
             try
             {
                 var (culture, langKey) = DetermineCulture(languageCode);
@@ -364,6 +297,8 @@ namespace IEVRModManager.Helpers
                         Instance.Log(LogLevel.Warning, $"No strings loaded for language '{langKey}', falling back to en-US", true);
                         _currentStrings = GetStringsForLanguage("en-US");
                     }
+
+                    _appliedLanguageCode = languageCode;
                 }
             }
             catch (Exception ex)
@@ -379,6 +314,7 @@ namespace IEVRModManager.Helpers
                 {
                     EnsureStringsLoaded();
                     _currentStrings = GetStringsForLanguage("en-US");
+                    _appliedLanguageCode = null;
                 }
             }
         }
@@ -441,6 +377,8 @@ namespace IEVRModManager.Helpers
                 return new Dictionary<string, string>();
             }
 
+            EnsureLanguageLoaded(langKey);
+
             Instance.Log(LogLevel.Debug, $"GetStringsForLanguage: Looking for language key '{langKey}'. Available keys: {string.Join(", ", _allStrings.Keys)}", true);
 
             if (_allStrings.TryGetValue(langKey, out var strings))
@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Concurrent;
+using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using System.Text;
@@ -41,6 +42,11 @@ namespace IEVRModManager.Helpers
     {
         private static Logger? _instance;
         private static readonly object _lockObject = new object();
+        private static readonly char[] WordSeparators = { ' ', '\t' };
+        private static readonly HashSet<string> CommonAbbreviations = new(StringComparer.OrdinalIgnoreCase)
+        {
+            "etc.", "e.g.", "i.e.", "vs.", "Dr.", "Mr.", "Ms.", "Prof."
+        };
         
         private readonly ConcurrentQueue<LogEntry> _logQueue;
         private readonly string _logDirectory;
@@ -54,6 +60,7 @@ namespace IEVRModManager.Helpers
         private bool _isDisposed;
         private readonly CancellationTokenSource _cancellationTokenSource;
         private readonly Task _writerTask;
+        private TimestampPrefix? _timestampPrefixCache;
 
         /// <summary>
         /// Gets the singleton instance of the Logger.
@@ -312,7 +319,7 @@ namespace IEVRModManager.Helpers
         private string FormatLogEntry(LogEntry entry)
         {
             var timestamp = entry.Timestamp.ToString("yyyy-MM-dd HH:mm:ss.fff");
-            var level = entry.Level.ToString().ToUpper().PadRight(7);
+            var level = GetLevelLabel(entry.Level);
             var message = entry.Message;
 
             var logLine = $"{timestamp} [{level}] {message}";
@@ -325,11 +332,41 @@ namespace IEVRModManager.Helpers
             return logLine;
         }
 
+        private static string GetLevelLabel(LogLevel level)
+        {
+            // Padded labels are constants so file log lines don't rebuild them per entry
+            return level switch
+            {
+                LogLevel.Debug => "DEBUG  ",
+                LogLevel.Info => "INFO   ",
+                LogLevel.Warning => "WARNING",
+                LogLevel.Error => "ERROR  ",
+                _ => level.ToString().ToUpperInvariant().PadRight(7)
+            };
+        }
+
         private string FormatMessage(LogEntry entry)
         {
-            var timestamp = entry.Timestamp.ToString("HH:mm:ss");
             var message = NormalizeMessage(entry.Message);
-            return $"[{timestamp}] {message}";
+            return GetTimestampPrefix(entry.Timestamp) + message;
+        }
+
+        /// <summary>
+        /// Returns the "[HH:mm:ss] " prefix for a UI log line. Bursts of messages share the same
+        /// second, so the formatted prefix is cached and reused until the second changes.
+        /// </summary>
+        private string GetTimestampPrefix(DateTime timestamp)
+        {
+            var second = timestamp.Ticks / TimeSpan.TicksPerSecond;
+            var cached = _timestampPrefixCache;
+            if (cached != null && cached.Second == second)
+            {
+                return cached.Prefix;
+            }
+
+            var prefix = $"[{timestamp:HH:mm:ss}] ";
+            _timestampPrefixCache = new TimestampPrefix(second, prefix);
+            return prefix;
         }
 
         /// <summary>
@@ -350,19 +387,9 @@ namespace IEVRModManager.Helpers
             if (message.EndsWith(".") && !message.EndsWith("...") && message.Length > 1)
             {
                 // Check if it's likely an abbreviation (like "etc." or "e.g.")
-                var words = message.Split(new[] { ' ', '\t' }, StringSplitOptions.RemoveEmptyEntries);
-                if (words.Length > 0)
-                {
-                    var lastWord = words[words.Length - 1];
-                    // Keep period if it's a common abbreviation
-                    var commonAbbreviations = new[] { "etc.", "e.g.", "i.e.", "vs.", "Dr.", "Mr.", "Ms.", "Prof." };
-                    if (!commonAbbreviations.Contains(lastWord, StringComparer.OrdinalIgnoreCase))
-                    {
-                        // Remove trailing period
-                        message = message.Substring(0, message.Length - 1);
-                    }
-                }
-                else
+                var lastWord = message.Substring(message.LastIndexOfAny(WordSeparators) + 1);
+                // Keep period if it's a common abbreviation
+                if (!CommonAbbreviations.Contains(lastWord))
                 {
                     // Remove trailing period
                     message = message.Substring(0, message.Length - 1);
@@ -488,5 +515,7 @@ namespace IEVRModManager.Helpers
             public Exception? Exception { get; set; }
             public bool IsTechnical { get; set; }
         }
+
+        private sealed record TimestampPrefix(long Second, string Prefix);
     }
 }
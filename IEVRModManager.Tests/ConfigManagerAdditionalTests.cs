@@ -309,6 +309,100 @@ namespace IEVRModManager.Tests
             File.WriteAllText(path, json);
         }
 
+        [Fact]
+        public void Save_UnchangedConfig_SkipsWrite()
+        {
+            // Arrange
+            var manager = new ConfigManager(_testConfigPath);
+            SaveSampleConfig(manager, "Dark");
+            // A read-only file makes any actual rewrite fail, so success proves the write was skipped
+            File.SetAttributes(_testConfigPath, FileAttributes.ReadOnly);
+
+            try
+            {
+                // Act
+                var success = SaveSampleConfig(manager, "Dark");
+
+                // Assert
+                Assert.True(success);
+            }
+            finally
+            {
+                File.SetAttributes(_testConfigPath, FileAttributes.Normal);
+            }
+        }
+
+        [Fact]
+        public void Save_ChangedConfig_RewritesFile()
+        {
+            // Arrange
+            var manager = new ConfigManager(_testConfigPath);
+            SaveSampleConfig(manager, "Dark");
+
+            // Act
+            var success = SaveSampleConfig(manager, "Light");
+
+            // Assert
+            Assert.True(success);
+            Assert.Equal("Light", manager.Load().Theme);
+        }
+
+        [Fact]
+        public void Save_FileModifiedExternally_RewritesFile()
+        {
+            // Arrange
+            var manager = new ConfigManager(_testConfigPath);
+            SaveSampleConfig(manager, "Dark");
+            var externalConfig = manager.Load();
+            externalConfig.SelectedCpkName = "other.cpk";
+            SaveConfigToFile(_testConfigPath, externalConfig);
+            File.SetLastWriteTimeUtc(_testConfigPath, DateTime.UtcNow.AddMinutes(-5));
+
+            // Act
+            var success = SaveSampleConfig(manager, "Dark");
+
+            // Assert
+            Assert.True(success);
+            Assert.Equal("test.cpk", manager.Load().SelectedCpkName);
+        }
+
+        [Fact]
+        public void Load_ConfigWithEmptyDefaultValues_DoesNotRewriteFile()
+        {
+            // Arrange
+            var config = AppConfig.Default();
+            config.GamePath = _testConfigDir;
+            SaveConfigToFile(_testConfigPath, config);
+            var writeTime = DateTime.UtcNow.AddMinutes(-5);
+            File.SetLastWriteTimeUtc(_testConfigPath, writeTime);
+            var manager = new ConfigManager(_testConfigPath);
+
+            // Act
+            var loaded = manager.Load();
+
+            // Assert
+            Assert.Equal(string.Empty, loaded.LastAppliedProfile);
+            Assert.Equal(writeTime, File.GetLastWriteTimeUtc(_testConfigPath));
+        }
+
+        private bool SaveSampleConfig(ConfigManager manager, string theme)
+        {
+            // An existing game path keeps Load from trying to detect one through Steam
+            return manager.Save(
+                gamePath: _testConfigDir,
+                selectedCpkName: "test.cpk",
+                cfgBinPath: "",
+                violaCliPath: "",
+                tmpDir: Path.Combine(_testConfigDir, "tmp"),
+                modEntries: new List<ModEntry> { new ModEntry("Mod1", "C:\\Mods", enabled: true) },
+                lastKnownPacksSignature: "",
+                lastKnownSteamBuildId: "",
+                vanillaFallbackUntilUtc: DateTime.MinValue,
+                theme: theme,
+                language: "System"
+            );
+        }
+
         // Reuse TestableConfigManager from ConfigManagerTests
         private class TestableConfigManager : ConfigManager
         {
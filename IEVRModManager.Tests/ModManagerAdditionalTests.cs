@@ -122,6 +122,35 @@ namespace IEVRModManager.Tests
             Assert.Equal("NullValuesMod", mod.DisplayName); // Should fallback to directory name
         }
 
+        [Fact]
+        public void ScanMods_ModDataJsonWithNonStringValue_KeepsOtherFields()
+        {
+            // Arrange
+            var modPath = Path.Combine(_testModsDir, "NumericVersionMod");
+            Directory.CreateDirectory(modPath);
+            var modDataPath = Path.Combine(modPath, "mod_data.json");
+            var modData = new Dictionary<string, object>
+            {
+                { "Name", "Numeric Version Mod" },
+                { "Author", "Author" },
+                { "ModVersion", 1.5 },
+                { "GameVersion", "1.2.0" },
+                { "ModLink", "https://example.com/mod" }
+            };
+            File.WriteAllText(modDataPath, JsonSerializer.Serialize(modData));
+
+            // Act
+            var result = _modManager.ScanMods();
+
+            // Assert
+            var mod = result.First();
+            Assert.Equal("Numeric Version Mod", mod.DisplayName);
+            Assert.Equal("Author", mod.Author);
+            Assert.Equal(string.Empty, mod.ModVersion);
+            Assert.Equal("1.2.0", mod.GameVersion);
+            Assert.Equal("https://example.com/mod", mod.ModLink);
+        }
+
         [Fact]
         public void ScanMods_NewModsAddedAfterSavedConfig_AppendedToEnd()
         {
@@ -314,6 +343,56 @@ namespace IEVRModManager.Tests
             Assert.Empty(result); // Empty folder shouldn't be detected
         }
 
+        [Fact]
+        public void AnalyzeEnabledMods_PacksAndConflicts_ReturnsBothResults()
+        {
+            // Arrange
+            var mod1Path = Path.Combine(_testModsDir, "Mod1");
+            var mod2Path = Path.Combine(_testModsDir, "Mod2");
+            Directory.CreateDirectory(Path.Combine(mod1Path, "data", "packs"));
+            Directory.CreateDirectory(Path.Combine(mod2Path, "data"));
+            File.WriteAllText(Path.Combine(mod1Path, "data", "packs", "pack.bin"), "data1");
+            File.WriteAllText(Path.Combine(mod1Path, "data", "conflict.txt"), "data1");
+            File.WriteAllText(Path.Combine(mod2Path, "data", "conflict.txt"), "data2");
+
+            var modEntries = new List<ModEntry>
+            {
+                new ModEntry("Mod1", _testModsDir, enabled: true, displayName: "Mod 1"),
+                new ModEntry("Mod2", _testModsDir, enabled: true, displayName: "Mod 2")
+            };
+
+            // Act
+            var (packsModifiers, conflicts) = _modManager.AnalyzeEnabledMods(modEntries);
+
+            // Assert
+            Assert.Equal(_modManager.DetectPacksModifiers(modEntries), packsModifiers);
+            Assert.Single(packsModifiers);
+            Assert.Contains("Mod 1", packsModifiers);
+            Assert.Single(conflicts);
+            Assert.Equal(2, conflicts["conflict.txt"].Count);
+        }
+
+        [Fact]
+        public void AnalyzeEnabledMods_SingleModTouchingPacks_ReturnsNoConflicts()
+        {
+            // Arrange
+            var modPath = Path.Combine(_testModsDir, "PacksMod");
+            Directory.CreateDirectory(Path.Combine(modPath, "data", "packs"));
+            File.WriteAllText(Path.Combine(modPath, "data", "packs", "pack.bin"), "data");
+
+            var modEntries = new List<ModEntry>
+            {
+                new ModEntry("PacksMod", _testModsDir, enabled: true, displayName: "Packs Mod")
+            };
+
+            // Act
+            var (packsModifiers, conflicts) = _modManager.AnalyzeEnabledMods(modEntries);
+
+            // Assert
+            Assert.Single(packsModifiers);
+            Assert.Empty(conflicts);
+        }
+
         [Fact]
         public void GetEnabledMods_EmptyList_ReturnsEmptyList()
         {
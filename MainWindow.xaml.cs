@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Collections.ObjectModel;
 using System.Diagnostics;
@@ -7,6 +8,7 @@ using System.Linq;
 using System.Net.Http;
 using System.Text.Json;
 using System.Text.Json.Serialization;
+using System.Threading;
 using System.Threading.Tasks;
 using System.Windows;
 using System.Windows.Input;
@@ -30,6 +32,7 @@ namespace IEVRModManager
         private ViolaIntegration _viola;
         private readonly Managers.ProfileManager _profileManager;
         private ObservableCollection<ModEntryViewModel> _modEntries;
+        private readonly string _modsRoot;
         private readonly ObservableCollection<CpkOption> _availableCpkFiles = new();
         private static readonly HttpClient _httpClient = new();
         private static bool _httpClientDisposed = false;
@@ -37,18 +40,32 @@ namespace IEVRModManager
         private readonly object _configLock = new object();
         private bool _isApplying;
         private bool _isDownloadingCpkLists;
+        private int _modScanVersion;
+        private bool _hasScannedMods;
+        private bool _isScanningMods;
+        private bool _isApplyButtonEnabled = true;
         private DispatcherTimer? _playResetTimer;
         private DispatcherTimer? _updateCheckTimer;
         private DispatcherTimer? _appUpdateCheckTimer;
+        private DispatcherTimer? _saveConfigTimer;
+        private bool _hasReportedSaveFailure;
+        private static readonly TimeSpan SaveConfigDelay = TimeSpan.FromMilliseconds(300);
+        private const string StaleTempDirMarker = ".old-";
         private bool _isCheckingUpdates;
         private bool _isCheckingAppUpdates;
         private string? _previousProfileSelection;
         private static DateTime? _lastRateLimitHit;
         private static readonly TimeSpan RateLimitCooldown = TimeSpan.FromMinutes(5);
+        private readonly ConcurrentQueue<string> _pendingLogLines = new();
+        private int _isLogFlushScheduled;
+        private readonly Queue<string> _logLines = new();
+        private int _logTextLength;
         
         private const string VanillaCpkListFileName = "VanillaCpkList.cfg.bin";
         private const string LatestCpkListFileName = "LatestCpkList.cfg.bin";
         private const string CpkListFileName = "cpk_list.cfg.bin";
+        private const int MaxLogLines = 1000;
+        private const int LogTrimSlack = 200;
 
         /// <summary>
         /// Initializes a new instance of the <see cref="MainWindow"/> class and sets up the mod manager interface.
@@ -57,31 +74,19 @@ namespace IEVRModManager
         {
             InitializeComponent();
             
+            // Localize before the first layout pass so the window is measured once with its final texts
+            UpdateLocalizedTexts();
+            
             var logger = Helpers.Logger.Instance;
             logger.SetUICallback((message, level, isTechnical) =>
             {
-                Dispatcher.Invoke(() =>
+                var config = GetConfig();
+                if (isTechnical && !config.ShowTechnicalLogs)
                 {
-                    var config = GetConfig();
-                    if (isTechnical && !config.ShowTechnicalLogs)
-                    {
-                        return;
-                    }
-                    
-                    var formattedMessage = $"{message}\n";
-                    
-                    const int maxLogLines = 1000;
-                    var lines = LogTextBox.LineCount;
-                    if (lines > maxLogLines)
-                    {
-                        var startIndex = LogTextBox.GetCharacterIndexFromLineIndex(lines - maxLogLines);
-                        LogTextBox.Text = LogTextBox.Text.Substring(startIndex);
-                    }
-                    
-                    LogTextBox.AppendText(formattedMessage);
-                    LogTextBox.CaretIndex = LogTextBox.Text.Length;
-                    LogTextBox.ScrollToEnd();
-                });
+                    return;
+                }
+                
+                QueueLogLine(message);
             });
             
             _configManager = new ConfigManager();
@@ -90,6 +95,8 @@ namespace IEVRModManager
             _viola = new ViolaIntegration(message => logger.Info(message, true));
             _profileManager = new Managers.ProfileManager();
             _modEntries = new ObservableCollection<ModEntryViewModel>();
+            // Resolved once: Config.DefaultModsDir probes the filesystem on every access
+            _modsRoot = Path.GetFullPath(Config.DefaultModsDir);
             
             ModsListView.ItemsSource = _modEntries;
             CpkSelector.ItemsSource = _availableCpkFiles;
@@ -102,12 +109,13 @@ namespace IEVRModManager
             
             LoadLastAppliedProfileOnStartup();
             
-            ScanMods();
+            _ = ScanModsAsync();
             CleanupTempDir();
             
+            Closed += (_, _) => FlushPendingConfigSave();
+            
             Loaded += (s, e) => 
             {
-                UpdateLocalizedTexts();
                 RefreshProfileSelector();
                 var config = GetConfig();
                 if (!string.IsNullOrWhiteSpace(config.LastAppliedProfile))
@@ -135,6 +143,72 @@ namespace IEVRModManager
             _ = PrefetchModsIfNeededAsync();
         }
 
+        /// <summary>
+        /// Queues a log line for the activity log. Safe to call from any thread without blocking on the
+        /// UI thread. Bursts of messages are coalesced into a single deferred flush so the text box is
+        /// updated and laid out once per batch instead of per line.
+        /// </summary>
+        private void QueueLogLine(string message)
+        {
+            _pendingLogLines.Enqueue(message);
+            
+            if (Interlocked.Exchange(ref _isLogFlushScheduled, 1) == 0)
+            {
+                Dispatcher.InvokeAsync(FlushPendingLog, DispatcherPriority.Background);
+            }
+        }
+
+        private void FlushPendingLog()
+        {
+            Interlocked.Exchange(ref _isLogFlushScheduled, 0);
+            
+            var builder = new StringBuilder();
+            while (_pendingLogLines.TryDequeue(out var line))
+            {
+                builder.Append(line).Append('\n');
+                _logLines.Enqueue(line);
+            }
+            
+            if (builder.Length == 0)
+            {
+                return;
+            }
+            
+            // Only follow new output when the user has not scrolled up to read earlier lines
+            var isScrolledToEnd = LogTextBox.VerticalOffset + LogTextBox.ViewportHeight >= LogTextBox.ExtentHeight - 1;
+            
+            // The retained lines are kept in a ring buffer, so trimming rebuilds the text from it
+            // instead of reading the whole text back out of the text box and searching it. Trimming
+            // happens in chunks so the full text is only rewritten once every LogTrimSlack lines.
+            if (_logLines.Count > MaxLogLines + LogTrimSlack)
+            {
+                while (_logLines.Count > MaxLogLines)
+                {
+                    _logLines.Dequeue();
+                }
+                
+                builder.Clear();
+                foreach (var retainedLine in _logLines)
+                {
+                    builder.Append(retainedLine).Append('\n');
+                }
+                LogTextBox.Text = builder.ToString();
+                _logTextLength = builder.Length;
+            }
+            else
+            {
+                LogTextBox.AppendText(builder.ToString());
+                _logTextLength += builder.Length;
+            }
+            
+            if (isScrolledToEnd)
+            {
+                // Reading LogTextBox.Text would serialize the whole document just to get its length
+                LogTextBox.CaretIndex = _logTextLength;
+                LogTextBox.ScrollToEnd();
+            }
+        }
+
         /// <summary>
         /// Gets a thread-safe copy of the current configuration.
         /// </summary>
@@ -631,47 +705,93 @@ namespace IEVRModManager
             Log($"Profile '{profile.Name}' loaded.", "info", true);
         }
 
+        /// <summary>
+        /// Schedules a configuration save. Rapid successive changes (toggling, reordering, selection
+        /// changes while the UI is being populated) collapse into a single write once they settle.
+        /// </summary>
+        private void ScheduleSaveConfig()
+        {
+            if (_saveConfigTimer == null)
+            {
+                _saveConfigTimer = new DispatcherTimer
+                {
+                    Interval = SaveConfigDelay
+                };
+                _saveConfigTimer.Tick += (_, _) => SaveConfig();
+            }
+
+            _saveConfigTimer.Stop();
+            _saveConfigTimer.Start();
+        }
+
+        private void FlushPendingConfigSave()
+        {
+            if (_saveConfigTimer != null && _saveConfigTimer.IsEnabled)
+            {
+                SaveConfig();
+            }
+        }
+
         private void SaveConfig()
         {
+            // A direct save covers any pending scheduled save
+            _saveConfigTimer?.Stop();
+            
             try
             {
                 var config = GetConfig();
-                // Update mods list from current entries
-                config.Mods = _modEntries.Select(me => new ModData
+                // Update mods list from current entries. Until the first scan has populated the list,
+                // keep the mods loaded from disk rather than overwriting them with an empty list.
+                if (_hasScannedMods)
                 {
-                    Name = me.Name,
-                    Enabled = me.Enabled,
-                    ModLink = me.ModLink
-                }).ToList();
+                    config.Mods = _modEntries.Select(me => new ModData
+                    {
+                        Name = me.Name,
+                        Enabled = me.Enabled,
+                        ModLink = me.ModLink
+                    }).ToList();
+                }
 
                 SetConfig(config);
                 var success = _configManager.Save(config);
 
                 if (!success)
                 {
-                    ShowError("CouldNotSaveConfiguration");
-                    Log("Could not save configuration.", "error");
+                    ReportSaveConfigFailure("Could not save configuration.");
+                    return;
                 }
+                
+                _hasReportedSaveFailure = false;
             }
             catch (Exceptions.ConfigurationException ex)
             {
-                ShowError("CouldNotSaveConfiguration");
-                Log($"Configuration error: {ex.Message}", "error");
-                if (ex.InnerException != null)
-                {
-                    Log($"Inner exception: {ex.InnerException.Message}", "error");
-                }
+                var details = ex.InnerException != null ? $" Inner exception: {ex.InnerException.Message}" : string.Empty;
+                ReportSaveConfigFailure($"Configuration error: {ex.Message}{details}");
             }
             catch (ArgumentNullException ex)
             {
-                ShowError("CouldNotSaveConfiguration");
-                Log($"Invalid configuration: {ex.Message}", "error");
+                ReportSaveConfigFailure($"Invalid configuration: {ex.Message}");
             }
             catch (Exception ex)
             {
-                ShowError("CouldNotSaveConfiguration");
-                Log($"Unexpected error saving configuration: {ex.Message}", "error");
+                ReportSaveConfigFailure($"Unexpected error saving configuration: {ex.Message}");
+            }
+        }
+
+        /// <summary>
+        /// Logs a failed configuration save. Saves happen automatically on most UI changes, so the error
+        /// dialog is only shown for the first failure until a save succeeds again.
+        /// </summary>
+        private void ReportSaveConfigFailure(string message)
+        {
+            Log(message, "error");
+            if (_hasReportedSaveFailure)
+            {
+                return;
             }
+            
+            _hasReportedSaveFailure = true;
+            ShowError("CouldNotSaveConfiguration");
         }
 
         private string? ResolveSelectedCpkPath()
@@ -946,17 +1066,62 @@ namespace IEVRModManager
 
         private void SetApplyButtonEnabled(bool isEnabled)
         {
-            ApplyButton.IsEnabled = isEnabled;
-            PlayButton.IsEnabled = isEnabled;
+            _isApplyButtonEnabled = isEnabled;
+            UpdateModActionsEnabled();
         }
 
-        private void ScanMods()
+        /// <summary>
+        /// Enables or disables the actions that read or reorder the mod list. They stay disabled while a
+        /// scan is running, so nothing acts on a list that is still empty or about to be replaced.
+        /// </summary>
+        private void UpdateModActionsEnabled()
+        {
+            var canUseModList = !_isScanningMods;
+
+            ApplyButton.IsEnabled = _isApplyButtonEnabled && canUseModList;
+            PlayButton.IsEnabled = _isApplyButtonEnabled;
+            RefreshModsButton.IsEnabled = canUseModList;
+            ManageProfilesButton.IsEnabled = canUseModList;
+            ProfileSelector.IsEnabled = canUseModList;
+            MoveUpButton.IsEnabled = canUseModList;
+            MoveDownButton.IsEnabled = canUseModList;
+            EnableAllButton.IsEnabled = canUseModList;
+            DisableAllButton.IsEnabled = canUseModList;
+        }
+
+        /// <summary>
+        /// Rescans the mods folder on a background thread (directory listing and mod_data.json parsing)
+        /// and applies the result to the list on the UI thread. If a newer scan starts before this one
+        /// finishes, this scan's result is discarded. Actions that use the mod list are disabled until
+        /// the scan completes.
+        /// </summary>
+        private async Task ScanModsAsync()
+        {
+            var scanVersion = ++_modScanVersion;
+            _isScanningMods = true;
+            UpdateModActionsEnabled();
+
+            try
+            {
+                await ScanModsCoreAsync(scanVersion);
+            }
+            finally
+            {
+                if (scanVersion == _modScanVersion)
+                {
+                    _isScanningMods = false;
+                    UpdateModActionsEnabled();
+                }
+            }
+        }
+
+        private async Task ScanModsCoreAsync(int scanVersion)
         {
             var savedMods = _config?.Mods ?? new List<ModData>();
             var existingEntries = _modEntries.Select(me => new ModEntry
             {
                 Name = me.Name,
-                Path = Config.DefaultModsDir,
+                Path = _modsRoot,
                 Enabled = me.Enabled,
                 DisplayName = me.DisplayName,
                 Author = me.Author,
@@ -965,20 +1130,66 @@ namespace IEVRModManager
                 ModLink = me.ModLink
             }).ToList();
 
-            var scannedMods = _modManager.ScanMods(savedMods, existingEntries);
-            
-            _modEntries.Clear();
+            List<ModEntry> scannedMods;
+            try
+            {
+                scannedMods = await Task.Run(() => _modManager.ScanMods(savedMods, existingEntries));
+            }
+            catch (Exception ex)
+            {
+                Log($"Error scanning mods: {ex.Message}", "error");
+                return;
+            }
+
+            if (scanVersion != _modScanVersion)
+            {
+                return;
+            }
+
+            // The scan worked from a snapshot; keep any enabled state changed in the list since then
+            var liveEnabled = _modEntries.ToDictionary(me => me.Name, me => me.Enabled);
             foreach (var mod in scannedMods)
             {
-                _modEntries.Add(new ModEntryViewModel(mod));
+                if (liveEnabled.TryGetValue(mod.Name, out var enabled))
+                {
+                    mod.Enabled = enabled;
+                }
             }
             
-            SaveConfig();
+            if (!MatchesCurrentModEntries(scannedMods))
+            {
+                _modEntries.Clear();
+                foreach (var mod in scannedMods)
+                {
+                    _modEntries.Add(new ModEntryViewModel(mod));
+                }
+            }
+            _hasScannedMods = true;
+            
+            ScheduleSaveConfig();
         }
 
-        private void ScanMods_Click(object sender, RoutedEventArgs e)
+        private bool MatchesCurrentModEntries(List<ModEntry> scannedMods)
         {
-            ScanMods();
+            if (scannedMods.Count != _modEntries.Count)
+            {
+                return false;
+            }
+
+            for (var i = 0; i < scannedMods.Count; i++)
+            {
+                if (!_modEntries[i].Matches(scannedMods[i]))
+                {
+                    return false;
+                }
+            }
+
+            return true;
+        }
+
+        private async void ScanMods_Click(object sender, RoutedEventArgs e)
+        {
+            await ScanModsAsync();
         }
 
         private void ModsListView_MouseDoubleClick(object sender, MouseButtonEventArgs e)
@@ -986,7 +1197,7 @@ namespace IEVRModManager
             if (ModsListView.SelectedItem is ModEntryViewModel selected)
             {
                 selected.Enabled = !selected.Enabled;
-                SaveConfig();
+                ScheduleSaveConfig();
             }
         }
 
@@ -1032,7 +1243,7 @@ namespace IEVRModManager
             {
                 _config.SelectedCpkName = selectedName;
                 _config.CfgBinPath = Path.Combine(Config.SharedStorageCpkDir, selectedName);
-                SaveConfig();
+                ScheduleSaveConfig();
             }
         }
 
@@ -1083,11 +1294,9 @@ namespace IEVRModManager
             var selectedIndex = ModsListView.SelectedIndex;
             if (selectedIndex <= 0) return;
 
-            var item = _modEntries[selectedIndex];
-            _modEntries.RemoveAt(selectedIndex);
-            _modEntries.Insert(selectedIndex - 1, item);
+            _modEntries.Move(selectedIndex, selectedIndex - 1);
             ModsListView.SelectedIndex = selectedIndex - 1;
-            SaveConfig();
+            ScheduleSaveConfig();
         }
 
         private void MoveDown_Click(object sender, RoutedEventArgs e)
@@ -1095,29 +1304,41 @@ namespace IEVRModManager
             var selectedIndex = ModsListView.SelectedIndex;
             if (selectedIndex < 0 || selectedIndex >= _modEntries.Count - 1) return;
 
-            var item = _modEntries[selectedIndex];
-            _modEntries.RemoveAt(selectedIndex);
-            _modEntries.Insert(selectedIndex + 1, item);
+            _modEntries.Move(selectedIndex, selectedIndex + 1);
             ModsListView.SelectedIndex = selectedIndex + 1;
-            SaveConfig();
+            ScheduleSaveConfig();
         }
 
         private void EnableAll_Click(object sender, RoutedEventArgs e)
         {
-            foreach (var mod in _modEntries)
-            {
-                mod.Enabled = true;
-            }
-            SaveConfig();
+            SetAllModsEnabled(true);
         }
 
         private void DisableAll_Click(object sender, RoutedEventArgs e)
         {
+            SetAllModsEnabled(false);
+        }
+
+        /// <summary>
+        /// Sets the enabled state of every mod, touching only the entries whose state actually changes,
+        /// and saves once for the whole batch (or not at all when nothing changed).
+        /// </summary>
+        private void SetAllModsEnabled(bool enabled)
+        {
+            var changed = false;
             foreach (var mod in _modEntries)
             {
-                mod.Enabled = false;
+                if (mod.Enabled != enabled)
+                {
+                    mod.Enabled = enabled;
+                    changed = true;
+                }
+            }
+
+            if (changed)
+            {
+                ScheduleSaveConfig();
             }
-            SaveConfig();
         }
 
         private async void CreateBackup_Click(object sender, RoutedEventArgs e)
@@ -1300,7 +1521,7 @@ namespace IEVRModManager
                 var modEntries = _modEntries.Select(me => new ModEntry
                 {
                     Name = me.Name,
-                    Path = Config.DefaultModsDir,
+                    Path = _modsRoot,
                     Enabled = me.Enabled,
                     DisplayName = me.DisplayName,
                     Author = me.Author,
@@ -1325,7 +1546,7 @@ namespace IEVRModManager
                     try
                     {
                         Directory.CreateDirectory(Path.GetDirectoryName(targetCpk)!);
-                        File.Copy(selectedCpkPath, targetCpk, true);
+                        CopyCpkListIfChanged(selectedCpkPath, targetCpk);
                         Log("CHANGES APPLIED!! No mods selected.", "success");
                         
                         // Show popup when no mods are selected
@@ -1356,7 +1577,7 @@ namespace IEVRModManager
                     return;
                 }
 
-                var packsModifiers = _modManager.DetectPacksModifiers(modEntries);
+                var (packsModifiers, conflicts) = _modManager.AnalyzeEnabledMods(modEntries);
                 if (packsModifiers.Count > 0)
                 {
                     var packsWarningWindow = new PacksWarningWindow(this, packsModifiers);
@@ -1371,7 +1592,6 @@ namespace IEVRModManager
                     Log($"Warning: {packsModifiers.Count} mod(s) will modify data/packs. User chose to continue.", "info", true);
                 }
 
-                var conflicts = _modManager.DetectFileConflicts(modEntries);
                 if (conflicts.Count > 0)
                 {
                     var conflictWindow = new ConflictWarningWindow(this, conflicts);
@@ -1387,8 +1607,6 @@ namespace IEVRModManager
                     Log($"Warning: {conflicts.Count} file conflict(s) detected. User chose to continue.", "info", true);
                 }
 
-                Directory.CreateDirectory(tmpRoot);
-
                 // Create and show progress window
                 ProgressWindow? progressWindow = null;
                 Dispatcher.Invoke(() =>
@@ -1402,12 +1620,10 @@ namespace IEVRModManager
                     // Create ViolaIntegration with progress callback
                     var progressCallback = new Action<int, string>((percentage, status) =>
                     {
-                        Dispatcher.Invoke(() =>
-                        {
-                            // Translate status message if it's a translation key
-                            string translatedStatus = TranslateProgressMessage(status);
-                            progressWindow?.UpdateProgress(percentage, translatedStatus);
-                        });
+                        // Translate status message if it's a translation key. UpdateProgress marshals
+                        // to the UI thread itself, so the merge thread is not blocked on every update.
+                        string translatedStatus = TranslateProgressMessage(status);
+                        progressWindow?.UpdateProgress(percentage, translatedStatus);
                     });
 
                     var violaWithProgress = new ViolaIntegration(
@@ -1724,6 +1940,22 @@ namespace IEVRModManager
             }
         }
 
+        /// <summary>
+        /// Copies a cpk_list file over the target unless the target already has identical contents,
+        /// avoiding a rewrite of the game's file (and its timestamp) when restoring the same list again.
+        /// </summary>
+        private static void CopyCpkListIfChanged(string sourcePath, string targetPath)
+        {
+            var targetInfo = new FileInfo(targetPath);
+            if (targetInfo.Exists && targetInfo.Length == new FileInfo(sourcePath).Length &&
+                File.ReadAllBytes(sourcePath).AsSpan().SequenceEqual(File.ReadAllBytes(targetPath)))
+            {
+                return;
+            }
+
+            File.Copy(sourcePath, targetPath, true);
+        }
+
         private void RestoreDataBackup(string gamePath, string backupRoot)
         {
             var backupDataPath = Path.Combine(backupRoot, "data");
@@ -1740,7 +1972,7 @@ namespace IEVRModManager
             if (File.Exists(cfgBackup))
             {
                 var cfgDest = Path.Combine(destDataPath, CpkListFileName);
-                File.Copy(cfgBackup, cfgDest, true);
+                CopyCpkListIfChanged(cfgBackup, cfgDest);
             }
             else
             {
@@ -1763,20 +1995,26 @@ namespace IEVRModManager
             }
         }
 
-        private void CopyDirectoryRecursive(string sourceDir, string destDir, bool overwrite)
+        private static void CopyDirectoryRecursive(string sourceDir, string destDir, bool overwrite)
         {
-            Directory.CreateDirectory(destDir);
+            // Walk the tree with an explicit stack so deep folder structures don't grow the call stack
+            var pending = new Stack<(string Source, string Destination)>();
+            pending.Push((sourceDir, destDir));
 
-            foreach (var file in Directory.GetFiles(sourceDir))
+            while (pending.Count > 0)
             {
-                var destFile = Path.Combine(destDir, Path.GetFileName(file));
-                File.Copy(file, destFile, overwrite);
-            }
+                var (source, destination) = pending.Pop();
+                Directory.CreateDirectory(destination);
 
-            foreach (var directory in Directory.GetDirectories(sourceDir))
-            {
-                var destSubDir = Path.Combine(destDir, Path.GetFileName(directory));
-                CopyDirectoryRecursive(directory, destSubDir, overwrite);
+                foreach (var file in Directory.EnumerateFiles(source))
+                {
+                    File.Copy(file, Path.Combine(destination, Path.GetFileName(file)), overwrite);
+                }
+
+                foreach (var directory in Directory.EnumerateDirectories(source))
+                {
+                    pending.Push((directory, Path.Combine(destination, Path.GetFileName(directory))));
+                }
             }
         }
 
@@ -1833,7 +2071,7 @@ namespace IEVRModManager
                     // Get applied mod names in order
                     // Create a dictionary for quick lookup by folder name
                     var modNameMap = _modEntries.ToDictionary(
-                        me => Path.GetFullPath(Path.Combine(Config.DefaultModsDir, me.Name)),
+                        me => Path.Combine(_modsRoot, me.Name),
                         me => me.DisplayName);
                     
                     var modNames = modPaths.Select(path =>
@@ -1982,14 +2220,19 @@ namespace IEVRModManager
 
         private void OpenModsFolder_Click(object sender, RoutedEventArgs e)
         {
-            var path = Path.GetFullPath(Config.DefaultModsDir);
-            if (Directory.Exists(path))
+            try
             {
-                System.Diagnostics.Process.Start("explorer.exe", path);
+                // _modsRoot is cached, so recreate the folder if it was deleted during the session
+                Directory.CreateDirectory(_modsRoot);
+                Process.Start(new ProcessStartInfo
+                {
+                    FileName = _modsRoot,
+                    UseShellExecute = true
+                });
             }
-            else
+            catch (Exception ex)
             {
-                ShowInfo("PathDoesNotExist", path);
+                ShowError("CouldNotOpenFolder", $"{_modsRoot}: {ex.Message}");
             }
         }
 
@@ -2521,14 +2764,19 @@ namespace IEVRModManager
             return Convert.ToHexString(sha.Hash ?? Array.Empty<byte>());
         }
 
+        /// <summary>
+        /// Empties the temporary folder without blocking startup. The old folder is renamed aside
+        /// (a cheap metadata operation) and a fresh one is created immediately; the recursive delete
+        /// of the renamed folder, which can hold a full merge output, runs on a background thread.
+        /// </summary>
         private void CleanupTempDir()
         {
-            var tmpRoot = _config?.TmpDir ?? Config.DefaultTmpDir;
+            var tmpRoot = _config.TmpDir.TrimEnd(Path.DirectorySeparatorChar, Path.AltDirectorySeparatorChar);
             if (Directory.Exists(tmpRoot))
             {
                 try
                 {
-                    Directory.Delete(tmpRoot, true);
+                    Directory.Move(tmpRoot, $"{tmpRoot}{StaleTempDirMarker}{DateTime.UtcNow.Ticks}");
                 }
                 catch (Exception ex)
                 {
@@ -2536,6 +2784,44 @@ namespace IEVRModManager
                 }
             }
             Directory.CreateDirectory(tmpRoot);
+
+            // Also picks up copies left behind when an earlier session exited or failed mid-delete
+            _ = Task.Run(() => DeleteStaleTempDirs(tmpRoot));
+        }
+
+        private static void DeleteStaleTempDirs(string tmpRoot)
+        {
+            var parentDir = Path.GetDirectoryName(tmpRoot);
+            if (string.IsNullOrEmpty(parentDir))
+            {
+                return;
+            }
+
+            var stalePrefix = Path.GetFileName(tmpRoot) + StaleTempDirMarker;
+            List<string> staleDirs;
+            try
+            {
+                staleDirs = Directory.EnumerateDirectories(parentDir, stalePrefix + "*")
+                    .Where(dir => Path.GetFileName(dir).StartsWith(stalePrefix, StringComparison.OrdinalIgnoreCase))
+                    .ToList();
+            }
+            catch (Exception ex)
+            {
+                System.Diagnostics.Debug.WriteLine($"Could not list stale temporary folders in {parentDir}: {ex.Message}");
+                return;
+            }
+
+            foreach (var staleDir in staleDirs)
+            {
+                try
+                {
+                    Directory.Delete(staleDir, true);
+                }
+                catch (Exception ex)
+                {
+                    System.Diagnostics.Debug.WriteLine($"Could not delete stale temporary folder {staleDir}: {ex.Message}");
+                }
+            }
         }
 
         private bool CheckReadWriteAccess(string targetFolder, string label)
@@ -2649,7 +2935,8 @@ namespace IEVRModManager
                 await _configManager.UpdateLastAppUpdateCheckUtcAsync(checkTime);
                 Log($"[AppUpdate] Saved check time: {checkTime:yyyy-MM-dd HH:mm:ss} UTC", "info", true);
                 
-                // Reload config to keep in-memory config in sync
+                // Reload config to keep in-memory config in sync; write any pending changes first
+                FlushPendingConfigSave();
                 SetConfig(_configManager.Load());
 
                 if (releaseInfo == null)
@@ -2825,6 +3112,11 @@ namespace IEVRModManager
             get => _enabled;
             set
             {
+                if (_enabled == value)
+                {
+                    return;
+                }
+
                 _enabled = value;
                 OnPropertyChanged(nameof(Enabled));
                 OnPropertyChanged(nameof(EnabledIcon));
@@ -2871,11 +3163,32 @@ namespace IEVRModManager
             Enabled = mod.Enabled;
             DisplayName = mod.DisplayName;
             Author = mod.Author;
-            ModVersion = string.IsNullOrEmpty(mod.ModVersion) ? "—" : mod.ModVersion;
-            GameVersion = string.IsNullOrEmpty(mod.GameVersion) ? "—" : mod.GameVersion;
+            ModVersion = FormatVersion(mod.ModVersion);
+            GameVersion = FormatVersion(mod.GameVersion);
             ModLink = mod.ModLink;
         }
 
+        /// <summary>
+        /// Determines whether this view model already shows the same data as the given <see cref="ModEntry"/>.
+        /// </summary>
+        /// <param name="mod">The mod entry to compare against.</param>
+        /// <returns>True if every displayed field matches; otherwise, false.</returns>
+        public bool Matches(ModEntry mod)
+        {
+            return Name == mod.Name
+                && Enabled == mod.Enabled
+                && DisplayName == mod.DisplayName
+                && Author == mod.Author
+                && ModVersion == FormatVersion(mod.ModVersion)
+                && GameVersion == FormatVersion(mod.GameVersion)
+                && ModLink == mod.ModLink;
+        }
+
+        private static string FormatVersion(string version)
+        {
+            return string.IsNullOrEmpty(version) ? "—" : version;
+        }
+
         /// <summary>
         /// Occurs when a property value changes.
         /// </summary>
@@ -15,14 +15,37 @@ namespace IEVRModManager.Managers
     /// </summary>
     public class ConfigManager
     {
+        private static readonly JsonSerializerOptions ReadJsonOptions = new JsonSerializerOptions
+        {
+            PropertyNameCaseInsensitive = true
+        };
+        private static readonly JsonSerializerOptions WriteJsonOptions = new JsonSerializerOptions
+        {
+            WriteIndented = true,
+            Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
+        };
+
         private readonly string _configPath;
+        private readonly object _writeCacheLock = new object();
+        private string? _lastWrittenJson;
+        private DateTime _lastWrittenTimeUtc;
 
         /// <summary>
         /// Initializes a new instance of the <see cref="ConfigManager"/> class.
         /// </summary>
         public ConfigManager()
+            : this(Config.ConfigPath)
         {
-            _configPath = Config.ConfigPath;
+        }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="ConfigManager"/> class that reads and writes
+        /// <paramref name="configPath"/> instead of the default configuration file.
+        /// </summary>
+        /// <param name="configPath">The full path of the configuration file.</param>
+        internal ConfigManager(string configPath)
+        {
+            _configPath = configPath;
             FileSystemHelper.EnsureDirectoryExists(Path.GetDirectoryName(_configPath));
         }
 
@@ -50,10 +73,7 @@ namespace IEVRModManager.Managers
                     return AppConfig.Default();
                 }
 
-                var config = JsonSerializer.Deserialize<AppConfig>(json, new JsonSerializerOptions
-                {
-                    PropertyNameCaseInsensitive = true
-                });
+                var config = JsonSerializer.Deserialize<AppConfig>(json, ReadJsonOptions);
                 
                 if (config == null)
                 {
@@ -108,10 +128,7 @@ namespace IEVRModManager.Managers
                     return AppConfig.Default();
                 }
 
-                var config = JsonSerializer.Deserialize<AppConfig>(json, new JsonSerializerOptions
-                {
-                    PropertyNameCaseInsensitive = true
-                });
+                var config = JsonSerializer.Deserialize<AppConfig>(json, ReadJsonOptions);
                 
                 if (config == null)
                 {
@@ -291,20 +308,25 @@ namespace IEVRModManager.Managers
 
         private bool MigrateStringProperty(JsonElement root, string propertyName, Func<string> getter, Action<string> setter, string defaultValue)
         {
-            if (!root.TryGetProperty(propertyName, out _) || string.IsNullOrWhiteSpace(getter()))
+            var isMissing = !root.TryGetProperty(propertyName, out _);
+            if (isMissing || string.IsNullOrWhiteSpace(getter()))
             {
+                // An empty value whose default is also empty is already what the file holds
+                var changed = isMissing || !string.Equals(getter(), defaultValue, StringComparison.Ordinal);
                 setter(defaultValue);
-                return true;
+                return changed;
             }
             return false;
         }
 
         private bool MigrateDateTimeProperty(JsonElement root, string propertyName, Func<DateTime> getter, Action<DateTime> setter, DateTime defaultValue)
         {
-            if (!root.TryGetProperty(propertyName, out _) || getter() == DateTime.MinValue)
+            var isMissing = !root.TryGetProperty(propertyName, out _);
+            if (isMissing || getter() == DateTime.MinValue)
             {
+                var changed = isMissing || getter() != defaultValue;
                 setter(defaultValue);
-                return true;
+                return changed;
             }
             return false;
         }
@@ -323,13 +345,7 @@ namespace IEVRModManager.Managers
         {
             try
             {
-                var options = new JsonSerializerOptions
-                {
-                    WriteIndented = true,
-                    Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
-                };
-
-                var json = JsonSerializer.Serialize(config, options);
+                var json = JsonSerializer.Serialize(config, WriteJsonOptions);
                 File.WriteAllText(_configPath, json);
                 Instance.Debug("Configuration migrated and saved successfully.", true);
             }
@@ -343,13 +359,7 @@ namespace IEVRModManager.Managers
         {
             try
             {
-                var options = new JsonSerializerOptions
-                {
-                    WriteIndented = true,
-                    Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
-                };
-
-                var json = JsonSerializer.Serialize(config, options);
+                var json = JsonSerializer.Serialize(config, WriteJsonOptions);
                 await File.WriteAllTextAsync(_configPath, json);
                 Instance.Debug("Configuration migrated and saved successfully.", true);
             }
@@ -591,14 +601,14 @@ namespace IEVRModManager.Managers
                 throw new ArgumentNullException(nameof(config));
             }
 
-            var options = new JsonSerializerOptions
+            var json = JsonSerializer.Serialize(config, WriteJsonOptions);
+            if (IsUnchangedOnDisk(json))
             {
-                WriteIndented = true,
-                Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
-            };
+                return;
+            }
 
-            var json = JsonSerializer.Serialize(config, options);
             File.WriteAllText(_configPath, json);
+            RememberWrittenPayload(json);
         }
 
         private async Task SaveConfigToFileAsync(AppConfig config)
@@ -608,14 +618,38 @@ namespace IEVRModManager.Managers
                 throw new ArgumentNullException(nameof(config));
             }
 
-            var options = new JsonSerializerOptions
+            var json = JsonSerializer.Serialize(config, WriteJsonOptions);
+            if (IsUnchangedOnDisk(json))
             {
-                WriteIndented = true,
-                Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
-            };
+                return;
+            }
 
-            var json = JsonSerializer.Serialize(config, options);
             await File.WriteAllTextAsync(_configPath, json);
+            RememberWrittenPayload(json);
+        }
+
+        /// <summary>
+        /// Determines whether <paramref name="json"/> is exactly what this instance last wrote and the file
+        /// has not been modified since, in which case the write can be skipped.
+        /// </summary>
+        private bool IsUnchangedOnDisk(string json)
+        {
+            lock (_writeCacheLock)
+            {
+                return _lastWrittenJson != null &&
+                       string.Equals(_lastWrittenJson, json, StringComparison.Ordinal) &&
+                       File.Exists(_configPath) &&
+                       File.GetLastWriteTimeUtc(_configPath) == _lastWrittenTimeUtc;
+            }
+        }
+
+        private void RememberWrittenPayload(string json)
+        {
+            lock (_writeCacheLock)
+            {
+                _lastWrittenJson = json;
+                _lastWrittenTimeUtc = File.GetLastWriteTimeUtc(_configPath);
+            }
         }
 
         /// <summary>
@@ -14,6 +14,16 @@ namespace IEVRModManager.Managers
     /// </summary>
     public class LastInstallManager
     {
+        private static readonly JsonSerializerOptions ReadJsonOptions = new JsonSerializerOptions
+        {
+            PropertyNameCaseInsensitive = true
+        };
+        private static readonly JsonSerializerOptions WriteJsonOptions = new JsonSerializerOptions
+        {
+            WriteIndented = true,
+            Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
+        };
+
         private readonly string _recordPath;
 
         /// <summary>
@@ -47,10 +57,7 @@ namespace IEVRModManager.Managers
                     return LastInstallInfo.Empty();
                 }
 
-                var info = JsonSerializer.Deserialize<LastInstallInfo>(json, new JsonSerializerOptions
-                {
-                    PropertyNameCaseInsensitive = true
-                });
+                var info = JsonSerializer.Deserialize<LastInstallInfo>(json, ReadJsonOptions);
                 return info ?? LastInstallInfo.Empty();
             }
             catch (JsonException ex)
@@ -89,10 +96,7 @@ namespace IEVRModManager.Managers
                     return LastInstallInfo.Empty();
                 }
 
-                var info = JsonSerializer.Deserialize<LastInstallInfo>(json, new JsonSerializerOptions
-                {
-                    PropertyNameCaseInsensitive = true
-                });
+                var info = JsonSerializer.Deserialize<LastInstallInfo>(json, ReadJsonOptions);
                 return info ?? LastInstallInfo.Empty();
             }
             catch (JsonException ex)
@@ -132,13 +136,7 @@ namespace IEVRModManager.Managers
             try
             {
                 FileSystemHelper.EnsureDirectoryExists(Path.GetDirectoryName(_recordPath));
-                var options = new JsonSerializerOptions
-                {
-                    WriteIndented = true,
-                    Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
-                };
-
-                var json = JsonSerializer.Serialize(info, options);
+                var json = JsonSerializer.Serialize(info, WriteJsonOptions);
                 File.WriteAllText(_recordPath, json);
                 return true;
             }
@@ -166,13 +164,7 @@ namespace IEVRModManager.Managers
             try
             {
                 FileSystemHelper.EnsureDirectoryExists(Path.GetDirectoryName(_recordPath));
-                var options = new JsonSerializerOptions
-                {
-                    WriteIndented = true,
-                    Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
-                };
-
-                var json = JsonSerializer.Serialize(info, options);
+                var json = JsonSerializer.Serialize(info, WriteJsonOptions);
                 await File.WriteAllTextAsync(_recordPath, json);
                 return true;
             }
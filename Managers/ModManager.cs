@@ -174,7 +174,10 @@ namespace IEVRModManager.Managers
 
         private static string? GetStringValue(Dictionary<string, JsonElement> data, string key)
         {
-            return data.TryGetValue(key, out var element) ? element.GetString() : null;
+            // Check the kind up front: GetString throws on non-string values, which would discard the whole file
+            return data.TryGetValue(key, out var element) && element.ValueKind == JsonValueKind.String
+                ? element.GetString()
+                : null;
         }
 
         /// <summary>
@@ -209,58 +212,8 @@ namespace IEVRModManager.Managers
                 throw new ArgumentNullException(nameof(modEntries));
             }
 
-            var modsTouchingPacks = new List<string>();
-            
-            foreach (var mod in modEntries.Where(me => me != null && me.Enabled))
-            {
-                if (ModTouchesPacksFolder(mod!))
-                {
-                    var displayName = string.IsNullOrWhiteSpace(mod!.DisplayName) ? mod.Name : mod.DisplayName;
-                    modsTouchingPacks.Add(displayName);
-                }
-            }
-
-            return modsTouchingPacks
-                .Distinct(StringComparer.OrdinalIgnoreCase)
-                .ToList();
-        }
-
-        private bool ModTouchesPacksFolder(ModEntry mod)
-        {
-            if (mod == null)
-            {
-                throw new ArgumentNullException(nameof(mod));
-            }
-
-            if (string.IsNullOrWhiteSpace(mod.FullPath))
-            {
-                return false;
-            }
-
-            try
-            {
-                var dataPath = Path.Combine(mod.FullPath, "data");
-                if (!Directory.Exists(dataPath))
-                {
-                    return false;
-                }
-
-                var files = Directory.GetFiles(dataPath, "*", SearchOption.AllDirectories);
-                return files.Any(filePath =>
-                {
-                    var relativePath = Path.GetRelativePath(dataPath, filePath)
-                        .Replace('\\', '/');
-                    return relativePath.StartsWith("packs/", StringComparison.OrdinalIgnoreCase);
-                });
-            }
-            catch (IOException)
-            {
-                return false;
-            }
-            catch (UnauthorizedAccessException)
-            {
-                return false;
-            }
+            var enabledMods = modEntries.Where(me => me != null && me.Enabled).ToList();
+            return FindPacksModifiers(CollectModDataFiles(enabledMods!));
         }
 
         /// <summary>
@@ -276,26 +229,46 @@ namespace IEVRModManager.Managers
                 throw new ArgumentNullException(nameof(modEntries));
             }
 
-            var conflicts = new Dictionary<string, List<string>>();
             var enabledMods = modEntries.Where(me => me != null && me.Enabled).ToList();
 
             if (enabledMods.Count < 2)
             {
-                return conflicts;
+                return new Dictionary<string, List<string>>();
             }
 
-            var fileToModsMap = BuildFileToModsMap(enabledMods!);
+            var fileToModsMap = BuildFileToModsMap(CollectModDataFiles(enabledMods!));
             return ExtractConflicts(fileToModsMap);
         }
 
-        private Dictionary<string, HashSet<string>> BuildFileToModsMap(List<ModEntry> enabledMods)
+        /// <summary>
+        /// Detects both the mods that modify the packs folder and the file conflicts between enabled mods,
+        /// walking each mod's data folder only once.
+        /// </summary>
+        /// <param name="modEntries">The list of mod entries to check.</param>
+        /// <returns>
+        /// The same results as <see cref="DetectPacksModifiers"/> and <see cref="DetectFileConflicts"/>.
+        /// </returns>
+        /// <exception cref="ArgumentNullException">Thrown when <paramref name="modEntries"/> is null.</exception>
+        public (List<string> PacksModifiers, Dictionary<string, List<string>> Conflicts) AnalyzeEnabledMods(List<ModEntry> modEntries)
         {
-            if (enabledMods == null)
+            if (modEntries == null)
             {
-                throw new ArgumentNullException(nameof(enabledMods));
+                throw new ArgumentNullException(nameof(modEntries));
             }
 
-            var fileToModsMap = new Dictionary<string, HashSet<string>>();
+            var enabledMods = modEntries.Where(me => me != null && me.Enabled).ToList();
+            var modDataFiles = CollectModDataFiles(enabledMods!);
+
+            var conflicts = enabledMods.Count < 2
+                ? new Dictionary<string, List<string>>()
+                : ExtractConflicts(BuildFileToModsMap(modDataFiles));
+
+            return (FindPacksModifiers(modDataFiles), conflicts);
+        }
+
+        private List<ModDataFiles> CollectModDataFiles(List<ModEntry> enabledMods)
+        {
+            var result = new List<ModDataFiles>();
 
             foreach (var mod in enabledMods)
             {
@@ -312,22 +285,12 @@ namespace IEVRModManager.Managers
                         continue;
                     }
 
-                    var files = Directory.GetFiles(modDataPath, "*", SearchOption.AllDirectories);
+                    var relativePaths = Directory.GetFiles(modDataPath, "*", SearchOption.AllDirectories)
+                        .Select(filePath => Path.GetRelativePath(modDataPath, filePath).Replace('\\', '/'))
+                        .ToList();
                     var displayName = string.IsNullOrWhiteSpace(mod.DisplayName) ? mod.Name : mod.DisplayName;
-                    
-                    foreach (var filePath in files)
-                    {
-                        var relativePath = Path.GetRelativePath(modDataPath, filePath)
-                            .Replace('\\', '/');
-
-                        if (!fileToModsMap.TryGetValue(relativePath, out var modSet))
-                        {
-                            modSet = new HashSet<string>();
-                            fileToModsMap[relativePath] = modSet;
-                        }
 
-                        modSet.Add(displayName);
-                    }
+                    result.Add(new ModDataFiles(displayName, relativePaths));
                 }
                 catch (IOException)
                 {
@@ -339,6 +302,36 @@ namespace IEVRModManager.Managers
                 }
             }
 
+            return result;
+        }
+
+        private static List<string> FindPacksModifiers(List<ModDataFiles> modDataFiles)
+        {
+            return modDataFiles
+                .Where(mod => mod.RelativePaths.Any(path => path.StartsWith("packs/", StringComparison.OrdinalIgnoreCase)))
+                .Select(mod => mod.DisplayName)
+                .Distinct(StringComparer.OrdinalIgnoreCase)
+                .ToList();
+        }
+
+        private Dictionary<string, HashSet<string>> BuildFileToModsMap(List<ModDataFiles> modDataFiles)
+        {
+            var fileToModsMap = new Dictionary<string, HashSet<string>>();
+
+            foreach (var mod in modDataFiles)
+            {
+                foreach (var relativePath in mod.RelativePaths)
+                {
+                    if (!fileToModsMap.TryGetValue(relativePath, out var modSet))
+                    {
+                        modSet = new HashSet<string>();
+                        fileToModsMap[relativePath] = modSet;
+                    }
+
+                    modSet.Add(mod.DisplayName);
+                }
+            }
+
             return fileToModsMap;
         }
 
@@ -363,6 +356,8 @@ namespace IEVRModManager.Managers
             return conflicts;
         }
 
+        private sealed record ModDataFiles(string DisplayName, List<string> RelativePaths);
+
         private class ModMetadata
         {
             public string DisplayName { get; set; } = string.Empty;
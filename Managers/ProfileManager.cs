@@ -22,6 +22,10 @@ namespace IEVRModManager.Managers
             WriteIndented = true,
             Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
         };
+        private static readonly JsonSerializerOptions ReadJsonOptions = new JsonSerializerOptions
+        {
+            PropertyNameCaseInsensitive = true
+        };
 
         /// <summary>
         /// Initializes a new instance of the <see cref="ProfileManager"/> class.
@@ -81,11 +85,7 @@ namespace IEVRModManager.Managers
                     return null;
                 }
 
-                var options = new JsonSerializerOptions
-                {
-                    PropertyNameCaseInsensitive = true
-                };
-                return JsonSerializer.Deserialize<ModProfile>(json, options);
+                return JsonSerializer.Deserialize<ModProfile>(json, ReadJsonOptions);
             }
             catch (JsonException ex)
             {
@@ -124,11 +124,7 @@ namespace IEVRModManager.Managers
                     return null;
                 }
 
-                var options = new JsonSerializerOptions
-                {
-                    PropertyNameCaseInsensitive = true
-                };
-                return JsonSerializer.Deserialize<ModProfile>(json, options);
+                return JsonSerializer.Deserialize<ModProfile>(json, ReadJsonOptions);
             }
             catch (JsonException ex)
             {
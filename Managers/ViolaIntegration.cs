@@ -245,9 +245,7 @@ namespace IEVRModManager.Managers
 
             try
             {
-                var totalFiles = CountFiles(tmpDataDir);
-                var copiedFiles = 0;
-                CopyDirectory(tmpDataDir, gameDataDir, true, totalFiles, ref copiedFiles);
+                CopyDirectory(tmpDataDir, gameDataDir, true);
                 _logCallback("Copy completed.");
                 _progressCallback?.Invoke(90, "CleaningUpTemporaryFiles");
                 return true;
@@ -373,33 +371,33 @@ namespace IEVRModManager.Managers
             return arg;
         }
 
-        private void CopyDirectory(string sourceDir, string destDir, bool overwrite, int totalFiles, ref int copiedFiles)
+        private void CopyDirectory(string sourceDir, string destDir, bool overwrite)
         {
-            var dir = new DirectoryInfo(sourceDir);
-            Directory.CreateDirectory(destDir);
+            // List the tree once; the same entries give the progress total and drive the copy.
+            // Directories are listed before their contents, so each target folder exists before its files are copied.
+            var entries = new DirectoryInfo(sourceDir)
+                .EnumerateFileSystemInfos("*", SearchOption.AllDirectories)
+                .ToList();
+            var totalFiles = entries.Count(entry => entry is FileInfo);
+            var copiedFiles = 0;
 
-            CopyFilesInDirectory(dir, destDir, overwrite, totalFiles, ref copiedFiles);
-            CopySubdirectories(dir, destDir, overwrite, totalFiles, ref copiedFiles);
-        }
+            Directory.CreateDirectory(destDir);
 
-        private void CopyFilesInDirectory(DirectoryInfo dir, string destDir, bool overwrite, int totalFiles, ref int copiedFiles)
-        {
-            foreach (var file in dir.GetFiles())
+            foreach (var entry in entries)
             {
-                var targetFilePath = Path.Combine(destDir, file.Name);
-                file.CopyTo(targetFilePath, overwrite);
-                copiedFiles++;
-                
-                UpdateCopyProgress(copiedFiles, totalFiles);
-            }
-        }
+                var targetPath = Path.Combine(destDir, Path.GetRelativePath(sourceDir, entry.FullName));
 
-        private void CopySubdirectories(DirectoryInfo dir, string destDir, bool overwrite, int totalFiles, ref int copiedFiles)
-        {
-            foreach (var subDir in dir.GetDirectories())
-            {
-                var newDestDir = Path.Combine(destDir, subDir.Name);
-                CopyDirectory(subDir.FullName, newDestDir, overwrite, totalFiles, ref copiedFiles);
+                if (entry is FileInfo file)
+                {
+                    file.CopyTo(targetPath, overwrite);
+                    copiedFiles++;
+
+                    UpdateCopyProgress(copiedFiles, totalFiles);
+                }
+                else
+                {
+                    Directory.CreateDirectory(targetPath);
+                }
             }
         }
 
@@ -414,18 +412,6 @@ namespace IEVRModManager.Managers
                 _progressCallback(progress, $"CopyingFiles:{copiedFiles}:{totalFiles}");
             }
         }
-
-        private static int CountFiles(string directory)
-        {
-            try
-            {
-                return Directory.GetFiles(directory, "*", SearchOption.AllDirectories).Length;
-            }
-            catch
-            {
-                return 0;
-            }
-        }
     }
 }
 
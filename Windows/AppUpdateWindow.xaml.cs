@@ -18,6 +18,10 @@ namespace IEVRModManager.Windows
         private readonly string _currentVersion;
         private const string GameBananaUrl = "https://gamebanana.com/tools/21354";
 
+        // Building a pipeline registers every advanced extension; it is immutable, so build it once and share it
+        private static readonly Lazy<MarkdownPipeline> SharedMarkdownPipeline =
+            new Lazy<MarkdownPipeline>(() => new MarkdownPipelineBuilder().UseAdvancedExtensions().Build());
+
         /// <summary>
         /// Initializes a new instance of the <see cref="AppUpdateWindow"/> class.
         /// </summary>
@@ -32,13 +36,13 @@ namespace IEVRModManager.Windows
             _currentVersion = currentVersion;
             
             UpdateLocalizedTexts();
-            Loaded += (s, e) => UpdateLocalizedTexts();
         }
 
         private void UpdateLocalizedTexts()
         {
-            Title = LocalizationHelper.GetString("AppUpdateAvailable");
-            TitleText.Text = LocalizationHelper.GetString("AppUpdateAvailable");
+            var title = LocalizationHelper.GetString("AppUpdateAvailable");
+            Title = title;
+            TitleText.Text = title;
             
             var message = string.Format(
                 LocalizationHelper.GetString("AppUpdateAvailableMessage"),
@@ -101,16 +105,16 @@ namespace IEVRModManager.Windows
                 FontSize = 11
             };
 
+            // Get theme text color
+            var textColor = Application.Current.Resources["TextColor"];
+            var textBrush = textColor is Color color ? new SolidColorBrush(color) : Brushes.White;
+
             try
             {
-                // Get theme text color
-                var textColor = Application.Current.Resources["TextColor"];
-                var textBrush = textColor is Color color ? new SolidColorBrush(color) : Brushes.White;
                 flowDocument.Foreground = textBrush;
 
                 // Use Markdig to convert markdown to HTML
-                var pipeline = new MarkdownPipelineBuilder().UseAdvancedExtensions().Build();
-                var html = Markdown.ToHtml(markdown, pipeline);
+                var html = Markdown.ToHtml(markdown, SharedMarkdownPipeline.Value);
                 
                 // Convert HTML to FlowDocument using simple parser
                 var converter = new HtmlToFlowDocumentConverter(textBrush);
@@ -119,9 +123,6 @@ namespace IEVRModManager.Windows
             catch
             {
                 // Fallback: show markdown as plain text if conversion fails
-                var textColor = Application.Current.Resources["TextColor"];
-                var textBrush = textColor is Color color ? new SolidColorBrush(color) : Brushes.White;
-                
                 var paragraph = new Paragraph(new Run(markdown))
                 {
                     Margin = new Thickness(0),
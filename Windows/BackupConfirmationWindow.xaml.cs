@@ -26,15 +26,13 @@ namespace IEVRModManager.Windows
             
             // Update localized texts
             UpdateLocalizedTexts(message, isRestore);
-            
-            // Ensure texts are updated after window is loaded
-            Loaded += (s, e) => UpdateLocalizedTexts(message, isRestore);
         }
         
         private void UpdateLocalizedTexts(string message, bool isRestore)
         {
-            Title = isRestore ? LocalizationHelper.GetString("ConfirmRestoreBackup") : LocalizationHelper.GetString("ConfirmCreateBackup");
-            TitleText.Text = isRestore ? LocalizationHelper.GetString("ConfirmRestoreBackup") : LocalizationHelper.GetString("ConfirmCreateBackup");
+            var title = LocalizationHelper.GetString(isRestore ? "ConfirmRestoreBackup" : "ConfirmCreateBackup");
+            Title = title;
+            TitleText.Text = title;
             MessageText.Text = message;
             ConfirmButton.Content = LocalizationHelper.GetString("Confirm");
             CancelButton.Content = LocalizationHelper.GetString("Cancel");
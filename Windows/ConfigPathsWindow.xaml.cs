@@ -1,8 +1,10 @@
 using System;
+using System.Collections.Generic;
 using System.Diagnostics;
 using System.IO;
 using System.Windows;
 using System.Windows.Forms;
+using System.Windows.Threading;
 using IEVRModManager.Models;
 using IEVRModManager.Helpers;
 using System.Threading.Tasks;
@@ -20,6 +22,33 @@ namespace IEVRModManager.Windows
         private readonly Func<Task> _restoreBackupAction;
         private readonly Func<Task> _checkForUpdatesAction;
         private readonly System.Action _openDownloadsAction;
+        private static string? _lastBrowseDirectory;
+        private static readonly TimeSpan GamePathSaveDelay = TimeSpan.FromMilliseconds(500);
+        private DispatcherTimer? _gamePathSaveTimer;
+
+        // Combo box tag -> localization key for the display name
+        private static readonly IReadOnlyDictionary<string, string> LanguageNameKeys = new Dictionary<string, string>
+        {
+            ["System"] = "System",
+            ["en-US"] = "English",
+            ["fr-FR"] = "French",
+            ["es-ES"] = "Espanol",
+            ["de-DE"] = "German",
+            ["ja-JP"] = "Japanese"
+        };
+
+        private static readonly IReadOnlyDictionary<string, string> ThemeNameKeys = new Dictionary<string, string>
+        {
+            ["System"] = "System",
+            ["Light"] = "Light",
+            ["Dark"] = "Dark",
+            ["Christmas"] = "Christmas",
+            ["Red"] = "Red",
+            ["Blue"] = "Blue",
+            ["Purple"] = "Purple",
+            ["Pastel"] = "Pastel",
+            ["Neon"] = "Neon"
+        };
 
         /// <summary>
         /// Initializes a new instance of the <see cref="ConfigPathsWindow"/> class.
@@ -44,14 +73,16 @@ namespace IEVRModManager.Windows
             _openDownloadsAction = openDownloadsAction;
             
             DataContext = _config;
+            Closed += (_, _) => FlushPendingGamePathSave();
             
             // Update localized texts
             UpdateLocalizedTexts();
             
-            // Try to detect game path from Steam if not configured
+            // Try to detect game path from Steam if not configured. The registry and library scan
+            // is deferred until the window has rendered so opening the window is not held up by it.
             if (string.IsNullOrWhiteSpace(_config.GamePath) || !Directory.Exists(_config.GamePath))
             {
-                TryDetectGamePathFromSteam();
+                ContentRendered += DetectGamePathOnFirstRender;
             }
             
             // Ensure initial values are displayed correctly
@@ -106,12 +137,9 @@ namespace IEVRModManager.Windows
                     _saveCallback?.Invoke();
                     
                     // Show modal with restart option (same as theme change)
-                    string languageName = language == "System" ? LocalizationHelper.GetString("System") + " (follows OS language)" : 
-                                         language == "en-US" ? LocalizationHelper.GetString("English") : 
-                                         language == "fr-FR" ? LocalizationHelper.GetString("French") :
-                                         language == "es-ES" ? LocalizationHelper.GetString("Espanol") :
-                                         language == "de-DE" ? LocalizationHelper.GetString("German") :
-                                         language == "ja-JP" ? LocalizationHelper.GetString("Japanese") : language;
+                    string languageName = language == "System"
+                        ? LocalizationHelper.GetString("System") + " (follows OS language)"
+                        : GetDisplayName(LanguageNameKeys, language);
                     var themeWindow = new ThemeChangeWindow(this, string.Format(LocalizationHelper.GetString("LanguageChangedMessage"), languageName));
                     var result = themeWindow.ShowDialog();
                     
@@ -150,16 +178,9 @@ namespace IEVRModManager.Windows
                     _saveCallback?.Invoke();
                     
                     // Show modal with restart option
-                    string themeName = theme == "System" ? LocalizationHelper.GetString("System") + " (follows OS theme)" :
-                                       theme == "Light" ? LocalizationHelper.GetString("Light") :
-                                       theme == "Dark" ? LocalizationHelper.GetString("Dark") :
-                                       theme == "Christmas" ? LocalizationHelper.GetString("Christmas") :
-                                       theme == "Red" ? LocalizationHelper.GetString("Red") :
-                                       theme == "Blue" ? LocalizationHelper.GetString("Blue") :
-                                       theme == "Purple" ? LocalizationHelper.GetString("Purple") :
-                                       theme == "Pastel" ? LocalizationHelper.GetString("Pastel") :
-                                       theme == "Neon" ? LocalizationHelper.GetString("Neon") :
-                                       theme;
+                    string themeName = theme == "System"
+                        ? LocalizationHelper.GetString("System") + " (follows OS theme)"
+                        : GetDisplayName(ThemeNameKeys, theme);
                     var themeWindow = new ThemeChangeWindow(this, themeName);
                     var result = themeWindow.ShowDialog();
                     
@@ -189,29 +210,73 @@ namespace IEVRModManager.Windows
         {
             using var dialog = new FolderBrowserDialog
             {
-                Description = "Select the game root folder"
+                Description = "Select the game root folder",
+                InitialDirectory = GetBrowseInitialDirectory()
             };
 
             if (dialog.ShowDialog() == System.Windows.Forms.DialogResult.OK)
             {
-                _config.GamePath = Path.GetFullPath(dialog.SelectedPath);
+                // The dialog always returns a rooted path, so no GetFullPath round-trip is needed
+                _lastBrowseDirectory = dialog.SelectedPath;
+                _config.GamePath = dialog.SelectedPath;
                 _saveCallback?.Invoke();
             }
         }
 
+        private string GetBrowseInitialDirectory()
+        {
+            var gamePath = _config.GamePath;
+            if (!string.IsNullOrWhiteSpace(gamePath) && Path.IsPathFullyQualified(gamePath) && Directory.Exists(gamePath))
+            {
+                return gamePath;
+            }
+
+            return _lastBrowseDirectory ?? string.Empty;
+        }
+
         private void GamePathTextBox_TextChanged(object sender, System.Windows.Controls.TextChangedEventArgs e)
         {
             if (sender is System.Windows.Controls.TextBox textBox)
             {
                 _config.GamePath = textBox.Text;
-                _saveCallback?.Invoke();
+                ScheduleGamePathSave();
             }
         }
 
+        /// <summary>
+        /// Saves the typed game path once typing pauses instead of writing the configuration on every keystroke.
+        /// </summary>
+        private void ScheduleGamePathSave()
+        {
+            if (_gamePathSaveTimer == null)
+            {
+                _gamePathSaveTimer = new DispatcherTimer
+                {
+                    Interval = GamePathSaveDelay
+                };
+                _gamePathSaveTimer.Tick += (_, _) => FlushPendingGamePathSave();
+            }
+
+            _gamePathSaveTimer.Stop();
+            _gamePathSaveTimer.Start();
+        }
+
+        private void FlushPendingGamePathSave()
+        {
+            if (_gamePathSaveTimer == null || !_gamePathSaveTimer.IsEnabled)
+            {
+                return;
+            }
+
+            _gamePathSaveTimer.Stop();
+            _saveCallback?.Invoke();
+        }
+
         private void UpdateLocalizedTexts()
         {
-            Title = LocalizationHelper.GetString("ConfigTitle");
-            ConfigTitleLabel.Content = LocalizationHelper.GetString("ConfigTitle");
+            var title = LocalizationHelper.GetString("ConfigTitle");
+            Title = title;
+            ConfigTitleLabel.Content = title;
             ConfigInfoLabel.Content = LocalizationHelper.GetString("ConfigSavedAutomatically");
             GamePathLabel.Content = LocalizationHelper.GetString("GamePath");
             BrowseButton.Content = LocalizationHelper.GetString("Browse");
@@ -242,49 +307,31 @@ namespace IEVRModManager.Windows
             // Update combo box items
             if (LanguageComboBox != null)
             {
-                foreach (System.Windows.Controls.ComboBoxItem item in LanguageComboBox.Items)
-                {
-                    if (item.Tag?.ToString() == "System")
-                        item.Content = LocalizationHelper.GetString("System");
-                    else if (item.Tag?.ToString() == "en-US")
-                        item.Content = LocalizationHelper.GetString("English");
-                    else if (item.Tag?.ToString() == "fr-FR")
-                        item.Content = LocalizationHelper.GetString("French");
-                    else if (item.Tag?.ToString() == "es-ES")
-                        item.Content = LocalizationHelper.GetString("Espanol");
-                    else if (item.Tag?.ToString() == "de-DE")
-                        item.Content = LocalizationHelper.GetString("German");
-                    else if (item.Tag?.ToString() == "ja-JP")
-                        item.Content = LocalizationHelper.GetString("Japanese");
-                }
+                ApplyItemDisplayNames(LanguageComboBox, LanguageNameKeys);
             }
             
             if (ThemeComboBox != null)
             {
-                foreach (System.Windows.Controls.ComboBoxItem item in ThemeComboBox.Items)
+                ApplyItemDisplayNames(ThemeComboBox, ThemeNameKeys);
+            }
+        }
+
+        private static void ApplyItemDisplayNames(System.Windows.Controls.ComboBox comboBox, IReadOnlyDictionary<string, string> nameKeys)
+        {
+            foreach (System.Windows.Controls.ComboBoxItem item in comboBox.Items)
+            {
+                if (item.Tag is string tag && nameKeys.TryGetValue(tag, out var key))
                 {
-                    if (item.Tag?.ToString() == "System")
-                        item.Content = LocalizationHelper.GetString("System");
-                    else if (item.Tag?.ToString() == "Light")
-                        item.Content = LocalizationHelper.GetString("Light");
-                    else if (item.Tag?.ToString() == "Dark")
-                        item.Content = LocalizationHelper.GetString("Dark");
-                    else if (item.Tag?.ToString() == "Christmas")
-                        item.Content = LocalizationHelper.GetString("Christmas");
-                    else if (item.Tag?.ToString() == "Red")
-                        item.Content = LocalizationHelper.GetString("Red");
-                    else if (item.Tag?.ToString() == "Blue")
-                        item.Content = LocalizationHelper.GetString("Blue");
-                    else if (item.Tag?.ToString() == "Purple")
-                        item.Content = LocalizationHelper.GetString("Purple");
-                    else if (item.Tag?.ToString() == "Pastel")
-                        item.Content = LocalizationHelper.GetString("Pastel");
-                    else if (item.Tag?.ToString() == "Neon")
-                        item.Content = LocalizationHelper.GetString("Neon");
+                    item.Content = LocalizationHelper.GetString(key);
                 }
             }
         }
 
+        private static string GetDisplayName(IReadOnlyDictionary<string, string> nameKeys, string tag)
+        {
+            return nameKeys.TryGetValue(tag, out var key) ? LocalizationHelper.GetString(key) : tag;
+        }
+
         private void ShowTechnicalLogsToggle_Changed(object sender, RoutedEventArgs e)
         {
             if (ShowTechnicalLogsToggle != null)
@@ -302,6 +349,7 @@ namespace IEVRModManager.Windows
             {
                 _config.ShowTechnicalLogs = ShowTechnicalLogsToggle.IsChecked ?? false;
             }
+            _gamePathSaveTimer?.Stop();
             _saveCallback?.Invoke();
             Close();
         }
@@ -411,6 +459,12 @@ namespace IEVRModManager.Windows
             _openDownloadsAction?.Invoke();
         }
 
+        private void DetectGamePathOnFirstRender(object? sender, EventArgs e)
+        {
+            ContentRendered -= DetectGamePathOnFirstRender;
+            TryDetectGamePathFromSteam();
+        }
+
         private void TryDetectGamePathFromSteam()
         {
             try
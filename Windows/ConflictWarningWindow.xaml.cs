@@ -27,8 +27,9 @@ namespace IEVRModManager.Windows
             Owner = parent;
 
             // Update localized texts
-            Title = LocalizationHelper.GetString("FileConflictsDetected");
-            TitleText.Text = LocalizationHelper.GetString("FileConflictsDetected");
+            var title = LocalizationHelper.GetString("FileConflictsDetected");
+            Title = title;
+            TitleText.Text = title;
             WarningMessage1.Text = LocalizationHelper.GetString("ConflictWarningMessage1");
             WarningMessage2.Text = LocalizationHelper.GetString("ConflictWarningMessage2");
             WarningMessage3.Text = LocalizationHelper.GetString("ConflictWarningMessage3");
@@ -1,7 +1,6 @@
 using System.Diagnostics;
 using System.Windows;
 using System.Windows.Input;
-using System.Windows.Media;
 using IEVRModManager;
 using IEVRModManager.Helpers;
 
@@ -36,36 +35,19 @@ namespace IEVRModManager.Windows
             CloseButton.Content = LocalizationHelper.GetString("Close");
         }
 
-        private void Link_MouseEnter(object sender, MouseEventArgs e)
+        private void Link_Click(object sender, MouseButtonEventArgs e)
         {
-            if (sender is System.Windows.Controls.TextBlock textBlock)
+            if (sender is System.Windows.Controls.TextBlock { Tag: string url })
             {
-                textBlock.TextDecorations = System.Windows.TextDecorations.Underline;
+                OpenUrl(url);
             }
         }
 
-        private void Link_MouseLeave(object sender, MouseEventArgs e)
-        {
-            if (sender is System.Windows.Controls.TextBlock textBlock)
-            {
-                textBlock.TextDecorations = null;
-            }
-        }
-
-        private void ViolaLink_Click(object sender, MouseButtonEventArgs e)
+        private static void OpenUrl(string url)
         {
             Process.Start(new ProcessStartInfo
             {
-                FileName = Config.ViolaReleaseUrl,
-                UseShellExecute = true
-            });
-        }
-
-        private void CpkListLink_Click(object sender, MouseButtonEventArgs e)
-        {
-            Process.Start(new ProcessStartInfo
-            {
-                FileName = Config.CpkListUrl,
+                FileName = url,
                 UseShellExecute = true
             });
         }
@@ -79,19 +61,10 @@ namespace IEVRModManager.Windows
             else
             {
                 // Fallback: open the link if owner is not available
-                CpkListLink_Click(sender, null!);
+                OpenUrl(Config.CpkListUrl);
             }
         }
 
-        private void GameBananaLink_Click(object sender, MouseButtonEventArgs e)
-        {
-            Process.Start(new ProcessStartInfo
-            {
-                FileName = Config.GameBananaModsUrl,
-                UseShellExecute = true
-            });
-        }
-
         private void Close_Click(object sender, RoutedEventArgs e)
         {
             Close();
@@ -25,9 +25,6 @@ namespace IEVRModManager.Windows
             
             // Update localized texts
             UpdateLocalizedTexts(message);
-            
-            // Ensure texts are updated after window is loaded
-            Loaded += (s, e) => UpdateLocalizedTexts(message);
         }
         
         private void UpdateLocalizedTexts(string message)
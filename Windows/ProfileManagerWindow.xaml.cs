@@ -48,8 +48,9 @@ namespace IEVRModManager.Windows
 
         private void UpdateLocalizedTexts()
         {
-            Title = LocalizationHelper.GetString("ModProfiles");
-            TitleLabel.Content = LocalizationHelper.GetString("ModProfiles");
+            var title = LocalizationHelper.GetString("ModProfiles");
+            Title = title;
+            TitleLabel.Content = title;
             LoadButton.Content = LocalizationHelper.GetString("Load");
             SaveButton.Content = LocalizationHelper.GetString("Save");
             DeleteButton.Content = LocalizationHelper.GetString("Delete");
@@ -11,6 +11,10 @@ namespace IEVRModManager.Windows
     {
         private readonly Dispatcher _dispatcher;
         private bool _allowClose = false;
+        private readonly object _progressLock = new object();
+        private int _pendingPercentage;
+        private string _pendingStatus = string.Empty;
+        private bool _isProgressUpdateScheduled;
 
         /// <summary>
         /// Initializes a new instance of the <see cref="ProgressWindow"/> class.
@@ -23,8 +27,9 @@ namespace IEVRModManager.Windows
             _dispatcher = Dispatcher;
             
             // Update localized texts
-            Title = LocalizationHelper.GetString("ApplyingMods");
-            TitleText.Text = LocalizationHelper.GetString("ApplyingMods");
+            var title = LocalizationHelper.GetString("ApplyingMods");
+            Title = title;
+            TitleText.Text = title;
             
             // Prevent closing while processing, unless explicitly allowed
             Closing += (s, e) =>
@@ -50,14 +55,51 @@ namespace IEVRModManager.Windows
         /// </summary>
         /// <param name="percentage">The progress percentage (0-100).</param>
         /// <param name="status">The status message to display.</param>
+        /// <remarks>
+        /// Safe to call from any thread. Updates from background threads do not block the caller;
+        /// rapid updates are coalesced so only the latest values are applied on the next dispatcher pass.
+        /// </remarks>
         public void UpdateProgress(int percentage, string status)
         {
-            _dispatcher.Invoke(() =>
+            if (_dispatcher.CheckAccess())
             {
-                ProgressBar.Value = percentage;
-                StatusText.Text = status;
-                PercentageText.Text = $"{percentage}%";
-            });
+                ApplyProgress(percentage, status);
+                return;
+            }
+
+            lock (_progressLock)
+            {
+                _pendingPercentage = percentage;
+                _pendingStatus = status;
+                if (_isProgressUpdateScheduled)
+                {
+                    return;
+                }
+                _isProgressUpdateScheduled = true;
+            }
+
+            _dispatcher.InvokeAsync(ApplyPendingProgress);
+        }
+
+        private void ApplyPendingProgress()
+        {
+            int percentage;
+            string status;
+            lock (_progressLock)
+            {
+                percentage = _pendingPercentage;
+                status = _pendingStatus;
+                _isProgressUpdateScheduled = false;
+            }
+
+            ApplyProgress(percentage, status);
+        }
+
+        private void ApplyProgress(int percentage, string status)
+        {
+            ProgressBar.Value = percentage;
+            StatusText.Text = status;
+            PercentageText.Text = $"{percentage}%";
         }
 
         /// <summary>
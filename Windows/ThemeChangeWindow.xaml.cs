@@ -25,8 +25,9 @@ namespace IEVRModManager.Windows
             Owner = owner;
             
             // Update localized texts
-            Title = LocalizationHelper.GetString("ThemeChanged");
-            TitleText.Text = LocalizationHelper.GetString("ThemeChanged");
+            var title = LocalizationHelper.GetString("ThemeChanged");
+            Title = title;
+            TitleText.Text = title;
             MessageText.Text = string.Format(LocalizationHelper.GetString("ThemeChangedMessage"), themeName);
             RestartButton.Content = LocalizationHelper.GetString("RestartNow");
             LaterButton.Content = LocalizationHelper.GetString("Later");
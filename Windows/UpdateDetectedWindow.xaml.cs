@@ -25,15 +25,13 @@ namespace IEVRModManager.Windows
             
             // Update localized texts
             UpdateLocalizedTexts(message);
-            
-            // Ensure texts are updated after window is loaded
-            Loaded += (s, e) => UpdateLocalizedTexts(message);
         }
         
         private void UpdateLocalizedTexts(string message)
         {
-            Title = LocalizationHelper.GetString("UpdateDetected");
-            TitleText.Text = LocalizationHelper.GetString("UpdateDetected");
+            var title = LocalizationHelper.GetString("UpdateDetected");
+            Title = title;
+            TitleText.Text = title;
             MessageText.Text = message;
             CreateBackupButton.Content = LocalizationHelper.GetString("CreateBackup");
             CloseButton.Content = LocalizationHelper.GetString("Close");